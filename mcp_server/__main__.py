@@ -9,6 +9,15 @@ from .server import (
     run_server,
 )  # 👈 This stays the same (relative import) but folder name must change
 
+# Prefer uvloop's C event loop when it's installed; the stdlib selector
+# loop works fine, so this is a best-effort swap.
+try:
+    import uvloop
+
+    uvloop.install()
+except ImportError:
+    pass
+
 
 def main() -> None:
     asyncio.run(run_server())
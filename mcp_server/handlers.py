@@ -39,9 +39,15 @@ HANDLERS.PY TEMPLATE GUIDE:
 # from your_library import YourClass  # Your specific libraries
 
 # WEATHER EXAMPLE IMPORTS - REMOVE THESE!
+import asyncio
+import atexit
+import functools
 import os
-from datetime import datetime
+import time
+import types
+from datetime import date
 import httpx
+import orjson
 from dotenv import load_dotenv
 
 # ============================================================================
@@ -54,8 +60,19 @@ from dotenv import load_dotenv
 # CONFIG_VALUE = os.getenv("CONFIG_VALUE", "default_value")
 
 # WEATHER EXAMPLE CONFIG - REMOVE THIS!
-load_dotenv()
-WEATHER_API_KEY = os.getenv("WEATHER_API_KEY")
+@functools.lru_cache(maxsize=1)
+def _api_key() -> str:
+    """Resolve the API key on first use instead of at import time.
+
+    Keeps the .env filesystem walk off the import path and lets tests
+    mutate os.environ before the first call (or call _api_key.cache_clear()
+    to force a re-read).
+    """
+    load_dotenv()
+    key = os.getenv("WEATHER_API_KEY")
+    if not key:
+        raise ValueError("Weather API key not set.")
+    return key
 
 
 # ============================================================================
@@ -75,37 +92,109 @@ WEATHER_API_KEY = os.getenv("WEATHER_API_KEY")
 
 
 # WEATHER EXAMPLE UTILITY - REMOVE THIS!
+@functools.lru_cache(maxsize=1024)
 def validate_date(dt_str: str) -> None:
-    """Example utility function - shows input validation pattern."""
+    """Example utility function - shows input validation pattern.
+
+    The format is fixed to YYYY-MM-DD, so a digit check plus a date()
+    construction beats strptime's locale-aware parser; the cache makes
+    repeated dates ("today", "tomorrow") a single dict lookup.
+    """
+    if (
+        len(dt_str) != 10
+        or dt_str[4] != "-"
+        or dt_str[7] != "-"
+        or not (dt_str[0:4] + dt_str[5:7] + dt_str[8:10]).isdigit()
+    ):
+        raise ValueError(f"Invalid date: {dt_str}. Use YYYY-MM-DD.")
     try:
-        datetime.strptime(dt_str, "%Y-%m-%d")
+        date(int(dt_str[0:4]), int(dt_str[5:7]), int(dt_str[8:10]))
     except ValueError:
         raise ValueError(f"Invalid date: {dt_str}. Use YYYY-MM-DD.")
 
 
+# WEATHER EXAMPLE CLIENT - REMOVE THIS!
+# A single shared client keeps connections alive between tool calls instead of
+# paying a fresh TCP+TLS handshake on every request.
+_CLIENT: httpx.AsyncClient | None = None
+
+
+def _client() -> httpx.AsyncClient:
+    """Return the shared HTTP client, creating it on first use."""
+    global _CLIENT
+    if _CLIENT is None:
+        _CLIENT = httpx.AsyncClient(
+            base_url="https://api.weatherapi.com/v1/",
+            timeout=httpx.Timeout(10.0),
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+        )
+    return _CLIENT
+
+
+def _close_client() -> None:
+    if _CLIENT is not None:
+        try:
+            asyncio.run(_CLIENT.aclose())
+        except RuntimeError:
+            # Pooled connections belong to the server's (already closed) event
+            # loop; the sockets die with the process anyway.
+            pass
+
+
+atexit.register(_close_client)
+
+
 # WEATHER EXAMPLE FUNCTION - REMOVE THIS!
+# Identical requests already in flight share one future, so a burst of
+# concurrent calls for the same endpoint+params costs a single upstream
+# fetch. The future is dropped as soon as it resolves - this is request
+# coalescing, not caching.
+_INFLIGHT: dict[tuple, asyncio.Task] = {}
+
+
+def _flight_done(flight_key: tuple):
+    def _cb(task: asyncio.Task) -> None:
+        _INFLIGHT.pop(flight_key, None)
+        if not task.cancelled():
+            # Mark a failure retrieved even if every waiter was cancelled.
+            task.exception()
+
+    return _cb
+
+
 async def fetch(endpoint: str, params: dict) -> dict:
+    """Fetch endpoint, coalescing concurrent identical requests."""
+    flight_key = (endpoint, tuple(sorted(params.items())))
+    task = _INFLIGHT.get(flight_key)
+    if task is None:
+        task = asyncio.get_running_loop().create_task(_do_fetch(endpoint, params))
+        _INFLIGHT[flight_key] = task
+        task.add_done_callback(_flight_done(flight_key))
+    # shield: one caller being cancelled must not cancel the shared
+    # fetch out from under everyone else awaiting it.
+    return await asyncio.shield(task)
+
+
+async def _do_fetch(endpoint: str, params: dict) -> dict:
     """Example HTTP client function - shows API call patterns with error handling."""
-    if not WEATHER_API_KEY:
-        raise ValueError("Weather API key not set.")
-
-    params["key"] = WEATHER_API_KEY
-    url = f"https://api.weatherapi.com/v1/{endpoint}"
-    async with httpx.AsyncClient() as client:
+    params["key"] = _api_key()
+    try:
+        resp = await _client().get(endpoint, params=params)
         try:
-            resp = await client.get(url, params=params)
-            try:
-                data = resp.json()
-            except Exception:
-                data = None
-            if resp.status_code != 200:
-                detail = (data or {}).get("error", {}).get("message", resp.text)
-                raise ValueError(f"WeatherAPI error: {detail}")
-            return data
-        except httpx.RequestError as e:
-            raise ValueError(f"Request error: {e}")
-        except Exception as e:
-            raise ValueError(f"Unexpected error: {e}")
+            # orjson parses the float-heavy forecast payloads far faster
+            # than stdlib json and returns plain dicts/lists.
+            data = orjson.loads(resp.content)
+        except orjson.JSONDecodeError:
+            data = None
+        if resp.status_code != 200:
+            detail = (data or {}).get("error", {}).get("message", resp.text)
+            raise ValueError(f"WeatherAPI error: {detail}")
+        return data
+    except httpx.RequestError as e:
+        raise ValueError(f"Request error: {e}")
+    except Exception as e:
+        raise ValueError(f"Unexpected error: {e}")
 
 
 # ============================================================================
@@ -164,14 +253,33 @@ async def your_api_tool(query: str, options: dict = None) -> dict:
 # 🌤️ WEATHER EXAMPLE FUNCTIONS - REMOVE ALL OF THESE!
 # The following functions are examples showing different patterns:
 
+# WeatherAPI wants "yes"/"no" flags; bools index the tuple directly.
+_YN = ("no", "yes")
+
+# Current conditions and location searches are stable over short windows, so
+# repeated identical calls can skip the network. Entries are (monotonic
+# insert time, result); TTLs roughly match WeatherAPI's own update cadence.
+_CURRENT_TTL = 60.0
+_CURRENT_CACHE: dict[tuple[str, bool], tuple[float, dict]] = {}
+_SEARCH_TTL = 30.0
+_SEARCH_CACHE: dict[str, tuple[float, dict]] = {}
+_CACHE_MAX_ENTRIES = 1024
+
 
 # WEATHER EXAMPLE - Simple function with validation
 async def get_current_weather(query: str, include_air_quality: bool = False) -> dict:
     if not query:
         raise ValueError("query with location is required.")
-    return await fetch(
-        "current.json", {"q": query, "aqi": "yes" if include_air_quality else "no"}
-    )
+    cache_key = (query, include_air_quality)
+    now = time.monotonic()
+    hit = _CURRENT_CACHE.get(cache_key)
+    if hit and now - hit[0] < _CURRENT_TTL:
+        return hit[1]
+    result = await fetch("current.json", {"q": query, "aqi": _YN[include_air_quality]})
+    _CURRENT_CACHE[cache_key] = (now, result)
+    if len(_CURRENT_CACHE) > _CACHE_MAX_ENTRIES:
+        _CURRENT_CACHE.pop(next(iter(_CURRENT_CACHE)))
+    return result
 
 
 # WEATHER EXAMPLE - Complex function with multiple parameters and validation
@@ -191,8 +299,8 @@ async def get_weather_forecast(
         {
             "q": query,
             "days": days,
-            "aqi": "yes" if include_air_quality else "no",
-            "alerts": "yes" if include_alerts else "no",
+            "aqi": _YN[include_air_quality],
+            "alerts": _YN[include_alerts],
         },
     )
 
@@ -203,8 +311,16 @@ async def get_weather_forecast(
 async def search_locations(query: str) -> dict:
     if not query:
         raise ValueError("query with location is required.")
+    now = time.monotonic()
+    hit = _SEARCH_CACHE.get(query)
+    if hit and now - hit[0] < _SEARCH_TTL:
+        return hit[1]
     locations = await fetch("search.json", {"q": query})
-    return {"items": locations}
+    result = {"items": locations}
+    _SEARCH_CACHE[query] = (now, result)
+    if len(_SEARCH_CACHE) > _CACHE_MAX_ENTRIES:
+        _SEARCH_CACHE.pop(next(iter(_SEARCH_CACHE)))
+    return result
 
 
 # ============================================================================
@@ -221,7 +337,11 @@ async def search_locations(query: str) -> dict:
 # }
 
 # WEATHER EXAMPLE MAPPING - REMOVE THIS! (Only 2 tools kept as examples)
-TOOL_FUNCTIONS = {
-    "get_weather": get_weather_forecast,
-    "search_locations": search_locations,
-}
+# Read-only so dispatch stays a plain hash lookup and nothing can swap
+# entries out from under the server at runtime.
+TOOL_FUNCTIONS = types.MappingProxyType(
+    {
+        "get_weather": get_weather_forecast,
+        "search_locations": search_locations,
+    }
+)
@@ -5,11 +5,14 @@
 # 2. Update server name on line 44 from "WeatherAPI" to your server name
 # 3. Update version on line 87 to your version
 
+import functools
 import json
 import logging
 import os
+from types import MappingProxyType
 from typing import Any
 
+from jsonschema import Draft202012Validator, ValidationError
 from mcp.server import NotificationOptions, Server
 from mcp.server.models import InitializationOptions
 import mcp.server.stdio
@@ -32,8 +35,14 @@ def _package_path(filename: str) -> str:
     return os.path.join(base_dir, filename)
 
 
-def load_tool_schemas() -> dict[str, Any]:
-    """Load tool schemas bundled in the package."""
+@functools.lru_cache(maxsize=1)
+def load_tool_schemas() -> MappingProxyType[str, Any]:
+    """Load tool schemas bundled in the package.
+
+    The result is cached (tools.json is parsed once per process) and returned
+    as a read-only mapping so the cached value can't be mutated by callers.
+    Call ``load_tool_schemas.cache_clear()`` to force a re-read.
+    """
     # Prefer package copy; fall back to CWD for local dev
     candidates = [
         _package_path("tools.json"),
@@ -43,19 +52,30 @@ def load_tool_schemas() -> dict[str, Any]:
         try:
             with open(path, "r") as f:
                 schema_data = json.load(f)
-            return {tool["name"]: tool for tool in schema_data["tools"]}
+            return MappingProxyType(
+                {tool["name"]: tool for tool in schema_data["tools"]}
+            )
         except FileNotFoundError:
             continue
         except json.JSONDecodeError as e:
             logger.error(f"Error parsing tools.json at {path}: {e}")
-            return {}
+            return MappingProxyType({})
     logger.error("tools.json file not found in package or working directory")
-    return {}
+    return MappingProxyType({})
 
 
 TOOL_SCHEMAS = load_tool_schemas()
 server = Server("WeatherAPI")
 
+# Compile one validator per (tool, direction) up front; building a validator
+# from the raw schema on every call would re-walk the schema each time.
+_VALIDATORS: dict[tuple[str, str], Draft202012Validator] = {}
+for _name, _schema in TOOL_SCHEMAS.items():
+    if "inputSchema" in _schema:
+        _VALIDATORS[(_name, "in")] = Draft202012Validator(_schema["inputSchema"])
+    if "outputSchema" in _schema:
+        _VALIDATORS[(_name, "out")] = Draft202012Validator(_schema["outputSchema"])
+
 
 @server.list_tools()
 async def handle_list_tools() -> list[types.Tool]:
@@ -80,14 +100,29 @@ async def handle_call_tool(name: str, arguments: dict[str, Any] | None) -> Any:
     if arguments is None:
         arguments = {}
 
+    validator = _VALIDATORS.get((name, "in"))
+    if validator is not None:
+        try:
+            validator.validate(arguments)
+        except ValidationError as e:
+            raise ValueError(f"Invalid arguments for tool {name}: {e.message}")
+
     try:
         tool_function = TOOL_FUNCTIONS[name]
         result = await tool_function(**arguments)
-        return result
     except Exception as e:
         logger.error(f"Error calling tool {name}: {e}")
         raise ValueError(f"Tool execution error: {str(e)}")
 
+    validator = _VALIDATORS.get((name, "out"))
+    if validator is not None:
+        try:
+            validator.validate(result)
+        except ValidationError as e:
+            logger.error(f"Tool {name} output does not match its schema: {e.message}")
+            raise ValueError(f"Tool output validation error: {e.message}")
+    return result
+
 
 async def run_server() -> None:
     async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):